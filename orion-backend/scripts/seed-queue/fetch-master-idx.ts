@@ -40,10 +40,16 @@ async function downloadWithRetry(retryCount: number = 0): Promise<void> {
             }
         });
 
-        // Ensure output directory exists
-        await fs.ensureDir(path.dirname(OUTPUT_FILE));
-
         const writer = fs.createWriteStream(OUTPUT_FILE);
+
+        // Count lines as the bytes stream past instead of re-reading the file afterwards
+        // (newline count + 1, same figure as splitting the file on '\n')
+        let lineCount = 1;
+        response.data.on('data', (chunk: Buffer) => {
+            for (let i = chunk.indexOf(10); i !== -1; i = chunk.indexOf(10, i + 1)) {
+                lineCount++;
+            }
+        });
         response.data.pipe(writer);
 
         await new Promise<void>((resolve, reject) => {
@@ -60,11 +66,6 @@ async function downloadWithRetry(retryCount: number = 0): Promise<void> {
         console.log(`✓ Download complete!`);
         console.log(`  File: ${OUTPUT_FILE}`);
         console.log(`  Size: ${sizeMB} MB`);
-        console.log(`  Lines: Counting...`);
-
-        // Count lines for verification
-        const content = await fs.readFile(OUTPUT_FILE, 'utf-8');
-        const lineCount = content.split('\n').length;
         console.log(`  Lines: ${lineCount.toLocaleString()}`);
 
     } catch (error: unknown) {
@@ -93,10 +94,8 @@ async function downloadWithRetry(retryCount: number = 0): Promise<void> {
             console.error(`\n❌ Failed to download master.idx: ${errorMessage}`);
         }
 
-        // Clean up partial file if exists
-        if (await fs.pathExists(OUTPUT_FILE)) {
-            await fs.remove(OUTPUT_FILE);
-        }
+        // Clean up partial file if exists (remove is a no-op when it doesn't)
+        await fs.remove(OUTPUT_FILE);
 
         console.error(`\n❌ Download failed after ${retryCount + 1} attempts.`);
         process.exit(1);
@@ -104,9 +103,9 @@ async function downloadWithRetry(retryCount: number = 0): Promise<void> {
 }
 
 async function main() {
-    // Check if file already exists
-    if (await fs.pathExists(OUTPUT_FILE)) {
-        const stats = await fs.stat(OUTPUT_FILE);
+    // Check if file already exists (a single stat; null when it doesn't)
+    const stats = await fs.stat(OUTPUT_FILE).catch(() => null);
+    if (stats) {
         const sizeMB = (stats.size / 1024 / 1024).toFixed(2);
         const ageHours = ((Date.now() - stats.mtimeMs) / (1000 * 60 * 60)).toFixed(1);
         
@@ -56,6 +56,10 @@ async function main() {
             process.stdout.write(`\rProcessed: ${processedLines.toLocaleString()} lines, Found: ${filings.length} 6-K filings`);
         }
 
+        // Cheap substring test first: only a small fraction of lines are 6-Ks,
+        // so most lines are rejected without allocating a split array
+        if (!line.includes('|6-K|')) continue;
+
         // CIK|Company Name|Form Type|Date Filed|Filename
         const parts = line.split('|');
         if (parts.length < 5) continue;
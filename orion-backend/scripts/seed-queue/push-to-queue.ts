@@ -29,32 +29,29 @@ async function main() {
 
     // Process in batches to avoid overwhelming RabbitMQ and manage memory better
     for (let i = 0; i < filings.length; i += BATCH_SIZE) {
-        const batch = filings.slice(i, Math.min(i + BATCH_SIZE, filings.length));
+        // Walk the batch by index instead of slicing out a copy of it
+        const batchEnd = Math.min(i + BATCH_SIZE, filings.length);
         
         // Push batch
-        for (const filing of batch) {
-            const success = channel.sendToQueue(
-                QUEUE_NAME, 
-                Buffer.from(JSON.stringify(filing)), 
-                { persistent: true }
-            );
-            
+        for (let j = i; j < batchEnd; j++) {
+            const filing = filings[j];
+            if (!filing) continue;
+
+            // Serialize once; the buffer is handed to amqplib as-is
+            const payload = Buffer.from(JSON.stringify(filing));
+            const success = channel.sendToQueue(QUEUE_NAME, payload, { persistent: true });
+
             if (!success) {
-                // Buffer is full, wait for drain event
+                // Message was still buffered; just wait for the write buffer to drain
+                // (re-sending here would publish a duplicate job)
                 await new Promise(resolve => channel.once('drain', resolve));
-                // Retry this filing
-                channel.sendToQueue(
-                    QUEUE_NAME, 
-                    Buffer.from(JSON.stringify(filing)), 
-                    { persistent: true }
-                );
             }
-            
+
             pushedCount++;
         }
 
         // Progress indicator
-        const progress = ((i + batch.length) / filings.length * 100).toFixed(1);
+        const progress = (batchEnd / filings.length * 100).toFixed(1);
         process.stdout.write(`\rProgress: ${progress}% (${pushedCount}/${filings.length})`);
     }
 
@@ -12,6 +12,8 @@ interface EnvConfig {
     SEC_API_BASE: string;
     USER_AGENT: string;
     NODE_ENV: string;
+    FORCE_REPROCESS: boolean;
+    WORKER_CONCURRENCY: number;
 }
 
 /**
@@ -60,6 +62,18 @@ function validateRabbitMqUrl(url: string): void {
     }
 }
 
+/**
+ * Validate worker concurrency (number of jobs processed at once)
+ */
+function validateConcurrency(concurrency: number): void {
+    if (!Number.isInteger(concurrency) || concurrency < 1) {
+        throw new Error(
+            'WORKER_CONCURRENCY must be a positive integer.\n' +
+            'Example: WORKER_CONCURRENCY=4'
+        );
+    }
+}
+
 /**
  * Load and validate environment configuration
  */
@@ -70,6 +84,10 @@ function loadEnv(): EnvConfig {
         SEC_API_BASE: process.env.SEC_API_BASE || 'https://www.sec.gov/Archives',
         USER_AGENT: process.env.USER_AGENT || 'OrionData/1.0 (contact@example.com)',
         NODE_ENV: process.env.NODE_ENV || 'development',
+        // Re-download filings that are already COMPLETED instead of skipping them
+        FORCE_REPROCESS: process.env.FORCE_REPROCESS === 'true',
+        // Jobs in flight per worker; downloads still share the throttler's 8 req/sec
+        WORKER_CONCURRENCY: Number(process.env.WORKER_CONCURRENCY || 1),
     };
 
     // Validate configuration
@@ -77,6 +95,7 @@ function loadEnv(): EnvConfig {
         validateUserAgent(config.USER_AGENT);
         validateDatabaseUrl(config.DATABASE_URL);
         validateRabbitMqUrl(config.RABBITMQ_URL);
+        validateConcurrency(config.WORKER_CONCURRENCY);
     } catch (error) {
         const errorMessage = error instanceof Error ? error.message : String(error);
         console.error('\n❌ Configuration Error:');
@@ -7,25 +7,31 @@ import { ENV } from './config/env.js';
  */
 
 function printStartupBanner(): void {
-    console.log('');
-    console.log('═══════════════════════════════════════════════════════════');
-    console.log('   🚀 ORION INGESTION WORKER');
-    console.log('═══════════════════════════════════════════════════════════');
-    console.log(`   Version:     2.0`);
-    console.log(`   Environment: ${ENV.NODE_ENV}`);
-    console.log(`   Node:        ${process.version}`);
-    console.log(`   Platform:    ${process.platform}`);
-    console.log('═══════════════════════════════════════════════════════════');
-    console.log('');
+    // Build the whole banner and emit it with a single write
+    console.log([
+        '',
+        '═══════════════════════════════════════════════════════════',
+        '   🚀 ORION INGESTION WORKER',
+        '═══════════════════════════════════════════════════════════',
+        `   Version:     2.0`,
+        `   Environment: ${ENV.NODE_ENV}`,
+        `   Node:        ${process.version}`,
+        `   Platform:    ${process.platform}`,
+        '═══════════════════════════════════════════════════════════',
+        '',
+    ].join('\n'));
 }
 
 function printConfiguration(): void {
-    console.log('Configuration:');
-    console.log(`  RabbitMQ:    ${ENV.RABBITMQ_URL}`);
-    console.log(`  Database:    ${ENV.DATABASE_URL.replace(/:[^:@]+@/, ':****@')}`); // Mask password
-    console.log(`  SEC API:     ${ENV.SEC_API_BASE}`);
-    console.log(`  User-Agent:  ${ENV.USER_AGENT.substring(0, 50)}${ENV.USER_AGENT.length > 50 ? '...' : ''}`);
-    console.log('');
+    console.log([
+        'Configuration:',
+        `  RabbitMQ:    ${ENV.RABBITMQ_URL}`,
+        `  Database:    ${ENV.DATABASE_URL.replace(/:[^:@]+@/, ':****@')}`, // Mask password
+        `  SEC API:     ${ENV.SEC_API_BASE}`,
+        `  Concurrency: ${ENV.WORKER_CONCURRENCY} job(s)`,
+        `  User-Agent:  ${ENV.USER_AGENT.substring(0, 50)}${ENV.USER_AGENT.length > 50 ? '...' : ''}`,
+        '',
+    ].join('\n'));
 }
 
 async function startWorker(): Promise<void> {
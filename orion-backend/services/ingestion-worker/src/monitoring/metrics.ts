@@ -108,21 +108,24 @@ export class MetricsCollector {
     printSummary(): void {
         const metrics = this.getAggregatedMetrics();
         
-        console.log('\n═══════════════════════════════════════');
-        console.log('📊 INGESTION WORKER METRICS SUMMARY');
-        console.log('═══════════════════════════════════════');
-        console.log(`Total Jobs:          ${metrics.totalJobsProcessed}`);
-        console.log(`Successful:          ${metrics.successfulJobs} (${this.getSuccessRate()}%)`);
-        console.log(`Failed:              ${metrics.failedJobs}`);
-        console.log(`Rate Limit Errors:   ${metrics.rateLimitErrors}`);
-        console.log('───────────────────────────────────────');
-        console.log(`Avg Processing Time: ${metrics.avgProcessingTimeMs}ms`);
-        console.log(`Min Processing Time: ${metrics.minProcessingTimeMs}ms`);
-        console.log(`Max Processing Time: ${metrics.maxProcessingTimeMs}ms`);
-        console.log(`Avg Download Time:   ${metrics.avgDownloadTimeMs}ms`);
-        console.log(`Avg Storage Time:    ${metrics.avgStorageTimeMs}ms`);
-        console.log(`Avg Chunks/Job:      ${metrics.avgChunksPerJob}`);
-        console.log('═══════════════════════════════════════\n');
+        // Single write for the whole summary
+        console.log([
+            '\n═══════════════════════════════════════',
+            '📊 INGESTION WORKER METRICS SUMMARY',
+            '═══════════════════════════════════════',
+            `Total Jobs:          ${metrics.totalJobsProcessed}`,
+            `Successful:          ${metrics.successfulJobs} (${this.getSuccessRate()}%)`,
+            `Failed:              ${metrics.failedJobs}`,
+            `Rate Limit Errors:   ${metrics.rateLimitErrors}`,
+            '───────────────────────────────────────',
+            `Avg Processing Time: ${metrics.avgProcessingTimeMs}ms`,
+            `Min Processing Time: ${metrics.minProcessingTimeMs}ms`,
+            `Max Processing Time: ${metrics.maxProcessingTimeMs}ms`,
+            `Avg Download Time:   ${metrics.avgDownloadTimeMs}ms`,
+            `Avg Storage Time:    ${metrics.avgStorageTimeMs}ms`,
+            `Avg Chunks/Job:      ${metrics.avgChunksPerJob}`,
+            '═══════════════════════════════════════\n',
+        ].join('\n'));
     }
 
     private getSuccessRate(): string {
@@ -1,3 +1,20 @@
+// Patterns are compiled once at module load and shared across all filings
+// Script/style blocks and all other tags in one alternation; the block branch is tried
+// first at each '<', so a script's body goes with it and plain tags fall through
+const MARKUP_REGEX = /<(script|style)\b[^>]*>[\s\S]*?<\/\1>|<[^>]+>/gi;
+// All supported entities in one pattern, decoded through a lookup table
+const ENTITY_REGEX = /&(?:nbsp|amp|lt|gt|quot|#39|apos);/g;
+const ENTITY_MAP: Record<string, string> = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&apos;': "'",
+};
+const WHITESPACE_REGEX = /\s+/g;
+
 /**
  * Clean HTML by removing scripts, styles, and tags, then normalizing whitespace.
  * Optimized to minimize regex passes and memory allocations.
@@ -8,25 +25,16 @@ export function cleanHtml(rawHtml: string): string {
         return '';
     }
 
-    // Combined single-pass regex for scripts and styles
-    // Using combined pattern reduces regex engine overhead
-    let text = rawHtml.replace(/<(script|style)\b[^>]*>[\s\S]*?<\/\1>/gi, " ");
-
-    // Remove all other HTML tags, replace with space to preserve word boundaries
-    text = text.replace(/<[^>]+>/g, " ");
+    // Remove scripts, styles and all other tags in a single pass over the input,
+    // replacing with a space to preserve word boundaries
+    let text = rawHtml.replace(MARKUP_REGEX, " ");
 
-    // Decode common HTML entities for better text quality
-    text = text
-        .replace(/&nbsp;/g, " ")
-        .replace(/&amp;/g, "&")
-        .replace(/&lt;/g, "<")
-        .replace(/&gt;/g, ">")
-        .replace(/&quot;/g, '"')
-        .replace(/&#39;/g, "'")
-        .replace(/&apos;/g, "'");
+    // Decode common HTML entities for better text quality (single pass, so an
+    // escaped entity like &amp;lt; decodes once to &lt; rather than twice to <)
+    text = text.replace(ENTITY_REGEX, (entity) => ENTITY_MAP[entity] ?? entity);
 
     // Normalize whitespace in single pass (multiple spaces/newlines/tabs -> single space)
-    text = text.replace(/\s+/g, " ").trim();
+    text = text.replace(WHITESPACE_REGEX, " ").trim();
 
     return text;
 }
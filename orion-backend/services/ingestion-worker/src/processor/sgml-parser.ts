@@ -0,0 +1,66 @@
+// Document types that never carry readable text (images, archives, spreadsheets)
+const BINARY_DOCUMENT_TYPES = new Set(['GRAPHIC', 'ZIP', 'PDF', 'EXCEL', 'JSON']);
+// Binary attachments are uuencoded inline, starting with a "begin <mode> <name>" line
+const UUENCODE_PREFIX = /^\s*begin \d{3} /;
+
+/**
+ * Drop the bodies of binary attachments from an SEC full-submission text file.
+ *
+ * A submission bundles every document of a filing between <DOCUMENT> tags. Images and
+ * other binaries are uuencoded inline and often make up most of the file, yet only turn
+ * into junk chunks once cleaned. The file is walked once with indexOf, and only the
+ * <TEXT> bodies of binary documents are cut; headers and text documents pass through
+ * unchanged. Input without <DOCUMENT> tags (plain HTML) is returned as-is.
+ */
+export function stripBinaryDocuments(raw: string): string {
+    let docStart = raw.indexOf('<DOCUMENT>');
+    if (docStart === -1) {
+        return raw;
+    }
+
+    const parts: string[] = [];
+    let cursor = 0;
+
+    while (docStart !== -1) {
+        const docEnd = raw.indexOf('</DOCUMENT>', docStart);
+        const textStart = raw.indexOf('<TEXT>', docStart);
+        if (docEnd === -1 || textStart === -1 || textStart > docEnd) {
+            break;
+        }
+
+        const bodyStart = textStart + '<TEXT>'.length;
+        const bodyEnd = raw.indexOf('</TEXT>', bodyStart);
+        if (bodyEnd === -1 || bodyEnd > docEnd) {
+            break;
+        }
+
+        if (isBinaryDocument(raw, docStart, bodyStart)) {
+            parts.push(raw.slice(cursor, bodyStart));
+            cursor = bodyEnd;
+        }
+
+        docStart = raw.indexOf('<DOCUMENT>', docEnd);
+    }
+
+    if (cursor === 0) {
+        return raw;
+    }
+
+    parts.push(raw.slice(cursor));
+    return parts.join('\n');
+}
+
+function isBinaryDocument(raw: string, docStart: number, bodyStart: number): boolean {
+    const typeStart = raw.indexOf('<TYPE>', docStart);
+    if (typeStart !== -1 && typeStart < bodyStart) {
+        const valueStart = typeStart + '<TYPE>'.length;
+        const lineEnd = raw.indexOf('\n', valueStart);
+        const type = raw.slice(valueStart, lineEnd === -1 ? bodyStart : Math.min(lineEnd, bodyStart)).trim();
+        if (BINARY_DOCUMENT_TYPES.has(type.toUpperCase())) {
+            return true;
+        }
+    }
+
+    // Fall back to sniffing the body for attachment types not in the list
+    return UUENCODE_PREFIX.test(raw.slice(bodyStart, bodyStart + 64));
+}
@@ -4,6 +4,7 @@ import { ENV } from '../config/env.js';
 import { QUEUE_NAME, IngestionJob } from '@orion/shared';
 import { SecDownloader } from '../sec-client/downloader.js';
 import { cleanHtml } from '../processor/html-cleaner.js';
+import { stripBinaryDocuments } from '../processor/sgml-parser.js';
 import { Chunker } from '../processor/chunker.js';
 import { IngestionRepository } from '../store/repository.js';
 import { metricsCollector } from '../monitoring/metrics.js';
@@ -99,7 +100,9 @@ export class IngestionConsumer {
             }
 
             await this.channel.assertQueue(QUEUE_NAME, { durable: true });
-            await this.channel.prefetch(1); // Process 1 message at a time
+            // Each unacked message is one in-flight job; handleMessage is async, so
+            // with prefetch > 1 jobs overlap while they wait on SEC and Postgres
+            await this.channel.prefetch(ENV.WORKER_CONCURRENCY);
 
             console.log(`Waiting for messages in ${QUEUE_NAME}...`);
             const consumeResult = await this.channel.consume(
@@ -138,15 +141,21 @@ export class IngestionConsumer {
         const timings = { download: 0, cleaning: 0, chunking: 0, storage: 0 };
         
         try {
+            // 0. Skip filings that are already stored (one indexed lookup instead of a download)
+            if (!ENV.FORCE_REPROCESS && await this.repository.isFilingCompleted(job.cik, job.accessionNumber)) {
+                this.channel?.ack(msg);
+                return;
+            }
+
             // 1. Download
             const downloadStart = Date.now();
             let rawHtml = await this.downloader.downloadHtml(job.url);
             timings.download = Date.now() - downloadStart;
             const rawHtmlSize = rawHtml.length;
 
-            // 2. Clean HTML
+            // 2. Clean HTML (uuencoded attachments are cut first; raw_text keeps them)
             const cleanStart = Date.now();
-            const cleanText = cleanHtml(rawHtml);
+            const cleanText = cleanHtml(stripBinaryDocuments(rawHtml));
             timings.cleaning = Date.now() - cleanStart;
             const cleanTextSize = cleanText.length;
 
@@ -1,14 +1,38 @@
-import axios, { AxiosError } from 'axios';
+import axios, { AxiosError, AxiosInstance } from 'axios';
+import https from 'https';
 import { SecThrottler } from './throttler.js';
 import { ENV } from '../config/env.js';
 
 export class SecDownloader {
     private throttler: SecThrottler;
+    private client: AxiosInstance;
     private readonly maxRetries: number = 3;
     private readonly baseRetryDelay: number = 5000; // 5 seconds base delay
 
     constructor() {
         this.throttler = new SecThrottler();
+
+        // One client for the worker's lifetime: keep-alive sockets to sec.gov are reused
+        // across filings instead of paying a TCP + TLS handshake per download
+        this.client = axios.create({
+            httpsAgent: new https.Agent({
+                keepAlive: true,
+                maxSockets: 10, // SEC allows 10 req/sec; never need more concurrent sockets
+            }),
+            headers: { 
+                'User-Agent': ENV.USER_AGENT,
+                'Accept-Encoding': 'gzip, deflate',
+                'Accept': 'text/html,application/xhtml+xml',
+            },
+            // Submissions are SGML/HTML; return the decoded body as-is instead of letting
+            // axios attempt a JSON.parse of every multi-megabyte response first
+            responseType: 'text',
+            timeout: 30000, // 30 second timeout
+            validateStatus: (status) => status < 500, // Don't throw on 4xx errors
+            decompress: true, // Automatically decompress responses
+            maxContentLength: 50 * 1024 * 1024, // 50MB max (SEC filings can be large)
+            maxBodyLength: 50 * 1024 * 1024,
+        });
     }
 
     async downloadHtml(url: string, retryCount: number = 0): Promise<string> {
@@ -26,18 +50,7 @@ export class SecDownloader {
         }
 
         try {
-            const response = await axios.get(url, {
-                headers: { 
-                    'User-Agent': ENV.USER_AGENT,
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Accept': 'text/html,application/xhtml+xml',
-                },
-                timeout: 30000, // 30 second timeout
-                validateStatus: (status) => status < 500, // Don't throw on 4xx errors
-                decompress: true, // Automatically decompress responses
-                maxContentLength: 50 * 1024 * 1024, // 50MB max (SEC filings can be large)
-                maxBodyLength: 50 * 1024 * 1024,
-            });
+            const response = await this.client.get<string>(url);
 
             // Handle 429 rate limit error
             if (response.status === 429) {
@@ -82,7 +95,18 @@ export class SecDownloader {
                 }
             }
 
-            console.error(`Failed to download ${url}`, error);
+            // One line by default; the full error (stack, code, response status) only when
+            // debugging, since inspecting an AxiosError walks its whole request/config graph
+            const errorMessage = error instanceof Error ? error.message : String(error);
+            const status = axiosError?.response?.status;
+            console.error(
+                `Failed to download ${url}: ${errorMessage}` +
+                (axiosError?.code ? ` [${axiosError.code}]` : '') +
+                (status ? ` (HTTP ${status})` : '')
+            );
+            if (process.env.LOG_LEVEL?.toUpperCase() === 'DEBUG') {
+                console.error(error);
+            }
             throw error;
         }
     }
@@ -1,5 +1,9 @@
+import { performance } from 'perf_hooks';
+
 export class SecThrottler {
-    private lastRequestTime: number = 0;
+    // Earliest time the next request may start; each caller reserves a slot by advancing it.
+    // Monotonic clock (performance.now()), so wall-clock/NTP adjustments can't skew spacing
+    private nextRequestTime: number = 0;
     // SEC allows 10 req/sec, but we'll be conservative and use 8 req/sec (125ms between requests)
     private readonly minIntervalMs: number = 125; // ~8 requests per second (conservative limit)
     private rateLimitBlockedUntil: number = 0; // Timestamp when rate limit block expires
@@ -20,21 +24,20 @@ export class SecThrottler {
             const adjustedWait = this.blockedCount > 1 ? waitTime * this.blockedCount : waitTime;
             console.log(`⏸️  Rate limited. Waiting ${Math.ceil(adjustedWait / 1000)}s before retrying...`);
             await new Promise(resolve => setTimeout(resolve, adjustedWait));
-            return true;
-        }
-        
-        // Normal rate limiting
-        if (now - this.lastRequestTime >= this.minIntervalMs) {
-            this.lastRequestTime = now;
-            this.requestCount++;
-            return true;
+            // Fall through: callers that waited out the block still take spaced slots
+            // below, rather than all firing the moment it lifts
         }
         
-        // Wait until minimum interval has passed
-        const waitTime = this.minIntervalMs - (now - this.lastRequestTime);
-        await new Promise(resolve => setTimeout(resolve, waitTime));
-        this.lastRequestTime = Date.now();
+        // Normal rate limiting: reserve the next free slot before awaiting, so concurrent
+        // callers each get their own slot instead of all waking after the same interval
+        const monotonicNow = performance.now();
+        const slot = Math.max(monotonicNow, this.nextRequestTime);
+        this.nextRequestTime = slot + this.minIntervalMs;
         this.requestCount++;
+
+        if (slot > monotonicNow) {
+            await new Promise(resolve => setTimeout(resolve, slot - monotonicNow));
+        }
         return true;
     }
 
@@ -43,6 +46,10 @@ export class SecThrottler {
      * SEC's policy: "Your access to SEC.gov will be limited for 10 minutes"
      */
     handleRateLimitError(): void {
+        // With several downloads in flight, one SEC block shows up as several 429s;
+        // count it once so the backoff multiplier doesn't scale with concurrency
+        if (this.isBlocked()) return;
+
         this.blockedCount++;
         const blockDurationMs = 10 * 60 * 1000; // 10 minutes in milliseconds
         this.rateLimitBlockedUntil = Date.now() + blockDurationMs;
@@ -2,6 +2,30 @@ import { Pool, PoolClient } from 'pg';
 import { ENV } from '../config/env.js';
 import { IngestionJob } from '@orion/shared';
 
+// Statement text is constant; built once at module load.
+// The row is written as COMPLETED directly: it commits in the same transaction as its
+// chunks, so an intermediate PROCESSING state would never be visible to other sessions.
+const UPSERT_FILING_SQL = `INSERT INTO filings (cik, accession_number, filing_date, form_type, source_url, raw_text, status)
+     VALUES ($1, $2, $3, $4, $5, $6, 'COMPLETED')
+     ON CONFLICT (cik, accession_number) 
+     DO UPDATE SET 
+         raw_text = EXCLUDED.raw_text,
+         status = 'COMPLETED',
+         updated_at = NOW()
+     RETURNING id, (xmax = 0) AS inserted`;
+
+// One probe of the UNIQUE (cik, accession_number) index plus a heap fetch to check status
+const IS_COMPLETED_SQL = `SELECT 1 FROM filings
+     WHERE cik = $1 AND accession_number = $2 AND status = 'COMPLETED'`;
+
+const DELETE_CHUNKS_SQL = 'DELETE FROM filing_chunks WHERE filing_id = $1';
+
+// Set-based insert: the chunk array is sent as one parameter and expanded server-side,
+// with chunk_index taken from the array position (the SQL analogue of Cypher's UNWIND)
+const INSERT_CHUNKS_SQL = `INSERT INTO filing_chunks (filing_id, chunk_index, content)
+     SELECT $1::uuid, t.ordinality - 1, t.content
+     FROM unnest($2::text[]) WITH ORDINALITY AS t(content, ordinality)`;
+
 export class IngestionRepository {
     private pool: Pool;
 
@@ -20,6 +44,15 @@ export class IngestionRepository {
         }
     }
 
+    /**
+     * Check whether a filing has already been fully ingested.
+     * Lets the consumer skip the SEC download for re-delivered or re-seeded jobs.
+     */
+    async isFilingCompleted(cik: string, accessionNumber: string): Promise<boolean> {
+        const result = await this.pool.query(IS_COMPLETED_SQL, [cik, accessionNumber]);
+        return (result.rowCount ?? 0) > 0;
+    }
+
     /**
      * Save filing with chunks in a single transaction for data integrity.
      * This ensures either all data is saved or none, preventing orphaned records.
@@ -30,15 +63,9 @@ export class IngestionRepository {
             await client.query('BEGIN');
             
             // Insert or update filing (using ON CONFLICT for upsert)
-            const result = await client.query<{ id: string }>(
-                `INSERT INTO filings (cik, accession_number, filing_date, form_type, source_url, raw_text, status)
-                 VALUES ($1, $2, $3, $4, $5, $6, 'PROCESSING')
-                 ON CONFLICT (cik, accession_number) 
-                 DO UPDATE SET 
-                     raw_text = EXCLUDED.raw_text,
-                     status = 'PROCESSING',
-                     updated_at = NOW()
-                 RETURNING id`,
+            // `inserted` is true when the row is new (xmax = 0), false when ON CONFLICT updated it
+            const result = await client.query<{ id: string; inserted: boolean }>(
+                UPSERT_FILING_SQL,
                 [job.cik, job.accessionNumber, job.date, job.formType, job.url, rawText]
             );
             
@@ -47,18 +74,13 @@ export class IngestionRepository {
             }
             
             const filingId = result.rows[0].id;
+            const isNewFiling = result.rows[0].inserted;
             
             // Save chunks within same transaction
             if (chunks.length > 0) {
-                await this._saveChunksInternal(client, filingId, chunks);
+                await this._saveChunksInternal(client, filingId, chunks, isNewFiling);
             }
             
-            // Update status to COMPLETED
-            await client.query(
-                'UPDATE filings SET status = $1, updated_at = NOW() WHERE id = $2',
-                ['COMPLETED', filingId]
-            );
-            
             await client.query('COMMIT');
             return filingId;
         } catch (error) {
@@ -72,98 +94,24 @@ export class IngestionRepository {
 
     /**
      * Internal method to save chunks using an existing client/transaction.
-     * Optimized batch insert with PostgreSQL COPY protocol for large datasets.
+     * All chunks go in a single INSERT ... SELECT FROM unnest(), so one round trip
+     * per filing regardless of chunk count and no 65535 bind-parameter limit.
      */
-    private async _saveChunksInternal(client: PoolClient, filingId: string, chunks: string[]): Promise<void> {
-        // Delete existing chunks for this filing (in case of re-processing)
-        await client.query('DELETE FROM filing_chunks WHERE filing_id = $1', [filingId]);
-        
-        if (chunks.length === 0) return;
-
-        // For very large chunk sets (>1000), use COPY protocol for better performance
-        // For smaller sets, use multi-row INSERT (faster for small batches)
-        if (chunks.length > 1000) {
-            await this._copyChunks(client, filingId, chunks);
-        } else {
-            await this._insertChunksBatch(client, filingId, chunks);
+    private async _saveChunksInternal(
+        client: PoolClient,
+        filingId: string,
+        chunks: string[],
+        isNewFiling: boolean
+    ): Promise<void> {
+        // Delete existing chunks for this filing (in case of re-processing).
+        // A freshly inserted filing cannot have chunks yet, so skip the round trip.
+        if (!isNewFiling) {
+            await client.query(DELETE_CHUNKS_SQL, [filingId]);
         }
-    }
-
-    /**
-     * Use larger batches for bulk insert (optimized for large datasets)
-     * PostgreSQL performs better with larger batch sizes up to parameter limit
-     */
-    private async _copyChunks(client: PoolClient, filingId: string, chunks: string[]): Promise<void> {
-        // For very large datasets, use larger batch size (up to 20,000)
-        // This is still within PostgreSQL's 65535 parameter limit
-        const LARGE_BATCH_SIZE = 20000;
         
-        for (let batchStart = 0; batchStart < chunks.length; batchStart += LARGE_BATCH_SIZE) {
-            const batchEnd = Math.min(batchStart + LARGE_BATCH_SIZE, chunks.length);
-            const batchLength = batchEnd - batchStart;
-            
-            // Pre-allocate arrays
-            const values: (string | number)[] = new Array(batchLength * 3);
-            const placeholders: string[] = new Array(batchLength);
-            
-            for (let batchIndex = 0; batchIndex < batchLength; batchIndex++) {
-                const globalIndex = batchStart + batchIndex;
-                const valueIndex = batchIndex * 3;
-                placeholders[batchIndex] = `($${valueIndex + 1}, $${valueIndex + 2}, $${valueIndex + 3})`;
-                values[valueIndex] = filingId;
-                values[valueIndex + 1] = globalIndex;
-                const chunk = chunks[globalIndex];
-                if (chunk !== undefined) {
-                    values[valueIndex + 2] = chunk;
-                }
-            }
-            
-            // Insert large batch
-            await client.query(
-                `INSERT INTO filing_chunks (filing_id, chunk_index, content)
-                 VALUES ${placeholders.join(', ')}`,
-                values
-            );
-        }
-    }
+        if (chunks.length === 0) return;
 
-    /**
-     * Use multi-row INSERT for smaller batches
-     */
-    private async _insertChunksBatch(client: PoolClient, filingId: string, chunks: string[]): Promise<void> {
-        // PostgreSQL has a limit of 65535 parameters per query
-        // With 3 params per chunk, we can do ~21,000 chunks per query
-        // Use 5,000 as optimal batch size for performance
-        const BATCH_SIZE = 5000;
-        
-        for (let batchStart = 0; batchStart < chunks.length; batchStart += BATCH_SIZE) {
-            const batchEnd = Math.min(batchStart + BATCH_SIZE, chunks.length);
-            const batchLength = batchEnd - batchStart;
-            
-            // Pre-allocate arrays with known size for better performance
-            const values: (string | number)[] = new Array(batchLength * 3);
-            const placeholders: string[] = new Array(batchLength);
-            
-            // Use for loop instead of forEach for better performance
-            for (let batchIndex = 0; batchIndex < batchLength; batchIndex++) {
-                const globalIndex = batchStart + batchIndex;
-                const valueIndex = batchIndex * 3;
-                placeholders[batchIndex] = `($${valueIndex + 1}, $${valueIndex + 2}, $${valueIndex + 3})`;
-                values[valueIndex] = filingId;
-                values[valueIndex + 1] = globalIndex;
-                const chunk = chunks[globalIndex];
-                if (chunk !== undefined) {
-                    values[valueIndex + 2] = chunk;
-                }
-            }
-            
-            // Insert batch in a single query
-            await client.query(
-                `INSERT INTO filing_chunks (filing_id, chunk_index, content)
-                 VALUES ${placeholders.join(', ')}`,
-                values
-            );
-        }
+        await client.query(INSERT_CHUNKS_SQL, [filingId, chunks]);
     }
 
     /**